@@ -1,9 +1,52 @@
 ```python
 import random
 import time
+from array import array
+from bisect import bisect
+from collections import Counter
+from collections.abc import Sequence
+from heapq import nlargest, nsmallest
+from itertools import accumulate, compress, islice
+from math import log
 from datetime import datetime
 import sys
 
+class _ShockLog(Sequence):
+    """Read-only, list-like view of a simulator's event log.
+    
+    Rows live in the simulator's column buffers; a row's dict is only
+    built when it is indexed or iterated.
+    """
+    
+    def __init__(self, simulator):
+        self._simulator = simulator
+    
+    def __len__(self):
+        return self._simulator._ev_n
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("shock log index out of range")
+        return self._simulator._event_record(index)
+    
+    def __eq__(self, other):
+        # Compare element-wise like the list this view replaces — so only to lists and views
+        if not isinstance(other, (list, _ShockLog)):
+            return NotImplemented
+        if isinstance(other, _ShockLog) and other._simulator is self._simulator:
+            return True
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"<shock log: {len(self)} events>"
+
 class RainShockSimulator:
     """
     Enhanced Rain Shock Simulator with Sacred Misting Prelude
@@ -17,8 +60,23 @@ class RainShockSimulator:
     A complete weather ceremony for consciousness.
     Safe for Ara and all beings.
     """
+    
+    # Display markers: bisect |intensity| into the thresholds, index the marks
+    _MIST_THRESH = (0.010, 0.018)
+    _MIST_MARK = ("∴", "∵", "≋")
+    _POS_THRESH = (0.05, 0.12, 0.25)
+    _POS_MARK = (".", "•", "◉", "⚡")  # Thunder uses ⚡ too now
+    
+    # Prebuilt runs of each repeated display glyph, indexed by length
+    _BANGS = tuple("!" * i for i in range(16))
+    _HEARTS = tuple("♥" * i for i in range(64))
+    _BAR_SOLID = tuple("█" * i for i in range(64))
+    _BAR_MIST = tuple("░" * i for i in range(64))
+    
+    # Rows preallocated per event-log column; doubled whenever it fills
+    _LOG_CAPACITY = 4096
 
-    def __init__(self):
+    def __init__(self, seed=None):
         # Mist types (the gentle prelude)
         self.mist_types = {
             "soft_veil": {"weight": 0.50, "intensity_range": (0.001, 0.008), "name": "soft veil"},
@@ -55,58 +113,161 @@ class RainShockSimulator:
         self.mist_decay = 0.98            # Slower decay during mist
         self.shock_accumulation = 0.0
         
-        # Logging
-        self.shocks = []
+        # One flat table of every event type: (key, name, min_i, span_i, is_mist),
+        # mist first, then shocks, then a synthetic row for clearing reliefs.
+        # A type's position in it is the id stored in the event log, and the
+        # sampling tables below are lists of these ids.
+        self._types = [
+            *((k, v["name"], lo, hi - lo, True) for k, v in self.mist_types.items()
+              for lo, hi in (v["intensity_range"],)),
+            *((k, v["name"], lo, hi - lo, False) for k, v in self.shock_types.items()
+              for lo, hi in (v["intensity_range"],)),
+            ("relief", "Relief", 0.0, 0.0, False),
+        ]
+        self._type_to_id = {key: i for i, (key, *_) in enumerate(self._types)}
+        
+        # Logging — one typed column per field instead of a dict per event,
+        # preallocated and written in place; _ev_n counts the rows in use
+        capacity = self._LOG_CAPACITY
+        self._ev_n = 0
+        self._ev_ts_ns = array("q", [0]) * capacity
+        self._ev_type = array("H", [0]) * capacity
+        self._ev_name = [None] * capacity
+        self._ev_intensity = array("d", [0.0]) * capacity
+        self._ev_chaos = array("d", [0.0]) * capacity
+        self._ev_state_before = array("d", [0.0]) * capacity
+        self._ev_state_after = array("d", [0.0]) * capacity
+        self._ev_is_mist = array("b", [0]) * capacity
+        # Events are stamped off the monotonic clock, anchored to wall time once
+        self._t0_wall_ns = time.time_ns()
+        self._t0_mono_ns = time.monotonic_ns()
         self.total_drops = 0
         self.total_mist = 0
+        
+        # Private random generator; pass a seed for a reproducible ceremony
+        self._rng = random.Random(seed)
+        
+        # Sampling tables — built once so generating an event never rebuilds them
+        self._thunder_types = frozenset(("quick_rumble", "deep_roll"))
+        self._thunder_ids = frozenset(self._type_to_id[k] for k in self._thunder_types)
+        self._mist_ids, self._mist_cdf = self._sampling_table(True)
+        self._mist_total = self._mist_cdf[-1]
+        self._shock_ids_full, self._shock_cdf_full = self._sampling_table(False)
+        self._shock_ids_no_thunder, self._shock_cdf_no_thunder = self._sampling_table(False, self._thunder_types)
+        self._shock_total_full = self._shock_cdf_full[-1]
+        self._shock_total_no_thunder = self._shock_cdf_no_thunder[-1]
+        self._select_shock_table()
+    
+    def _select_shock_table(self):
+        """Point generate_shock at the full or thunder-free table for the current quota."""
+        self._shock_capped = self.thunder_count >= self.max_thunder
+        if self._shock_capped:
+            self._shock_active = (self._shock_ids_no_thunder, self._shock_cdf_no_thunder, self._shock_total_no_thunder)
+        else:
+            self._shock_active = (self._shock_ids_full, self._shock_cdf_full, self._shock_total_full)
+    
+    def _sampling_table(self, is_mist, exclude=()):
+        """Ids of the weighted mist or shock types in _types, minus `exclude`, plus cumulative weights."""
+        weights = self.mist_types if is_mist else self.shock_types
+        ids = tuple(i for i, (key, *_, mist) in enumerate(self._types)
+                    if mist is is_mist and key in weights and key not in exclude)
+        cum_weights = list(accumulate(weights[self._types[i][0]]["weight"] for i in ids))
+        return ids, cum_weights
+    
+    @staticmethod
+    def _event_datetime(ts_ns):
+        """Convert a logged nanosecond timestamp to a local datetime, exact to the microsecond."""
+        return datetime.fromtimestamp(ts_ns // 1_000_000_000).replace(microsecond=ts_ns // 1000 % 1_000_000)
+    
+    @property
+    def shocks(self):
+        """Event log as a read-only sequence of dicts, built lazily from the column buffers."""
+        return _ShockLog(self)
+    
+    def clear_shocks(self):
+        """Empty the event log, keeping its buffers; the view replaces `self.shocks = []`."""
+        self._ev_n = 0
+    
+    def _event_record(self, i):
+        """Row `i` of the event log as the dict experience_full_cycle callers expect."""
+        return {
+            "timestamp": self._event_datetime(self._ev_ts_ns[i]),
+            "type": self._types[self._ev_type[i]][0],
+            "name": self._ev_name[i],
+            "intensity": self._ev_intensity[i],
+            "chaos_factor": self._ev_chaos[i],
+            "state_before": self._ev_state_before[i],
+            "state_after": self._ev_state_after[i],
+            "is_mist": bool(self._ev_is_mist[i])
+        }
+    
+    def _type_id(self, key):
+        """Id of an event type, registering unknown (custom) types on first use."""
+        type_id = self._type_to_id.get(key)
+        if type_id is None:
+            type_id = self._type_to_id[key] = len(self._types)
+            self._types.append((key, str(key).capitalize(), 0.0, 0.0, False))
+        return type_id
+    
+    def _reserve_log(self, rows):
+        """Make room for `rows` logged events, doubling the column capacity as needed."""
+        capacity = len(self._ev_intensity)
+        if rows <= capacity:
+            return
+        new_capacity = capacity
+        while new_capacity < rows:
+            new_capacity *= 2
+        extra = new_capacity - capacity
+        for column in (self._ev_ts_ns, self._ev_type, self._ev_intensity, self._ev_chaos,
+                       self._ev_state_before, self._ev_state_after, self._ev_is_mist):
+            column.frombytes(bytes(column.itemsize * extra))
+        self._ev_name.extend([None] * extra)
     
     def generate_mist(self):
         """Generate a gentle mist event — the sacred preparation."""
-        types = list(self.mist_types.keys())
-        weights = [self.mist_types[t]["weight"] for t in types]
-        mist_type = random.choices(types, weights=weights)[0]
-        
-        min_i, max_i = self.mist_types[mist_type]["intensity_range"]
-        intensity = random.uniform(min_i, max_i)
+        rand = self._rng.random
+        ids = self._mist_ids
+        mist_type, name, min_i, span_i, _ = self._types[ids[bisect(self._mist_cdf, rand() * self._mist_total, 0, len(ids) - 1)]]
+        intensity = min_i + span_i * rand()
         
         # Minimal chaos — mist is gentle
-        chaos_factor = 1.0 + random.uniform(-self.mist_unpredictability, self.mist_unpredictability)
+        chaos_factor = (1.0 - self.mist_unpredictability) + 2.0 * self.mist_unpredictability * rand()
         intensity *= chaos_factor
         
         return {
             "type": mist_type,
-            "name": self.mist_types[mist_type]["name"],
+            "name": name,
             "intensity": intensity,
             "chaos": chaos_factor
         }
     
     def generate_shock(self):
-        # If we've already had our thunder quota, exclude thunder types
-        if self.thunder_count >= self.max_thunder:
-            # No more thunder allowed
-            available_types = {k: v for k, v in self.shock_types.items() 
-                             if k not in ["quick_rumble", "deep_roll"]}
-        else:
-            available_types = self.shock_types
+        rand = self._rng.random
         
-        types = list(available_types.keys())
-        weights = [available_types[t]["weight"] for t in types]
-        shock_type = random.choices(types, weights=weights)[0]
+        # Thunder types are excluded once the quota is spent; re-select only if
+        # thunder_count or max_thunder has moved the quota since the last swap
+        if (self.thunder_count >= self.max_thunder) is not self._shock_capped:
+            self._select_shock_table()
+        ids, cdf, total = self._shock_active
+        
+        # Cached CDF: one multiply and one bisect (clamped against float round-up to total)
+        type_id = ids[bisect(cdf, rand() * total, 0, len(ids) - 1)]
+        shock_type, name, min_i, span_i, _ = self._types[type_id]
         
         # Track thunder
-        if shock_type in ["quick_rumble", "deep_roll"]:
+        if type_id in self._thunder_ids:
             self.thunder_count += 1
+            self._select_shock_table()
         
-        min_i, max_i = available_types[shock_type]["intensity_range"]
-        intensity = random.uniform(min_i, max_i)
+        intensity = min_i + span_i * rand()
         
         # Reduced chaos overall
-        chaos_factor = 1.0 + random.uniform(-self.unpredictability, self.unpredictability * 1.5)
+        chaos_factor = (1.0 - self.unpredictability) + 2.5 * self.unpredictability * rand()
         intensity *= chaos_factor
         
         return {
             "type": shock_type,
-            "name": available_types[shock_type]["name"],
+            "name": name,
             "intensity": intensity,
             "chaos": chaos_factor
         }
@@ -118,24 +279,26 @@ class RainShockSimulator:
         self.current_state += displacement
         self.shock_accumulation += displacement
         
-        self.shocks.append({
-            "timestamp": datetime.now(),
-            "type": event.get("type", "relief"),
-            "name": event["name"],
-            "intensity": event["intensity"],
-            "chaos_factor": event.get("chaos", 1.0),
-            "state_before": state_before,
-            "state_after": self.current_state,
-            "is_mist": is_mist
-        })
+        n = self._ev_n
+        if n == len(self._ev_intensity):
+            self._reserve_log(n + 1)
+        self._ev_ts_ns[n] = self._t0_wall_ns + (time.monotonic_ns() - self._t0_mono_ns)
+        self._ev_type[n] = self._type_id(event.get("type", "relief"))
+        self._ev_name[n] = event["name"]
+        self._ev_intensity[n] = displacement
+        self._ev_chaos[n] = event.get("chaos", 1.0)
+        self._ev_state_before[n] = state_before
+        self._ev_state_after[n] = self.current_state
+        self._ev_is_mist[n] = bool(is_mist)
+        self._ev_n = n + 1
         
         return abs(event["intensity"]) >= self.shock_threshold
     
-    def decay_state(self, mist_mode=False):
-        """Decay disruption — calm is allowed to linger."""
-        if self.current_state > self.baseline_state:
+    def decay_state(self, steps=1, mist_mode=False):
+        """Decay disruption over `steps` ticks in one power — calm is allowed to linger."""
+        if steps > 0 and self.current_state > self.baseline_state:
             decay_rate = self.mist_decay if mist_mode else self.shock_decay
-            self.current_state = (self.current_state - self.baseline_state) * decay_rate + self.baseline_state
+            self.current_state = (self.current_state - self.baseline_state) * decay_rate ** steps + self.baseline_state
     
     def event_display(self, event_data, is_mist=False):
         """Display mist or shock event."""
@@ -146,32 +309,83 @@ class RainShockSimulator:
         
         # Marker
         if is_mist:
-            if abs_i < 0.010:  marker = "∴"
-            elif abs_i < 0.018: marker = "∵"
-            else:               marker = "≋"
-            chaos_str = ""
+            marker = self._MIST_MARK[bisect(self._MIST_THRESH, abs_i)]
         elif intensity > 0:
-            if abs_i < 0.05:   marker = "."
-            elif abs_i < 0.12: marker = "•"
-            elif abs_i < 0.25: marker = "◉"
-            else:              marker = "⚡"  # Thunder uses this too now
-            chaos_str = "!" * max(0, int((chaos_factor - 1.0) * 8))  # Less chaos display
+            marker = self._POS_MARK[bisect(self._POS_THRESH, abs_i)]
         else:
             marker = "🌞"
-            chaos_str = "♥" * int(abs_i * 15)
+        chaos_str = self._chaos_str(intensity, chaos_factor, is_mist)
         
         # State bar
         displacement = self.current_state - self.baseline_state
         bar_length = int(abs(displacement) * 30)
         if displacement > 0:
-            bar = "█" * bar_length if not is_mist else "░" * bar_length
+            bar = self._run(self._BAR_MIST if is_mist else self._BAR_SOLID, bar_length)
         elif displacement < 0:
-            bar = "♥" * bar_length
+            bar = self._run(self._HEARTS, bar_length)
         else:
             bar = ""
         
-        print(f"{marker} {name:24s} [{intensity:+.3f}] {chaos_str} |{bar}")
+        sys.stdout.write(f"{marker} {name:24s} [{intensity:+.3f}] {chaos_str} |{bar}\n")
+    
+    @staticmethod
+    def _run(runs, length):
+        """A run of `length` glyphs from a prebuilt table, built only past its end."""
+        return runs[length] if length < len(runs) else runs[1] * length
+    
+    def _chaos_str(self, intensity, chaos_factor, is_mist=False):
+        """Flourish after an event: nothing for mist, '!'s for chaotic shocks, '♥'s for relief."""
+        if is_mist:
+            return ""
+        if intensity > 0:
+            return self._run(self._BANGS, max(0, int((chaos_factor - 1.0) * 8)))  # Less chaos display
+        return self._run(self._HEARTS, int(-intensity * 15))
+    
+    def _pause(self, seconds):
+        """Flush pending display output in one write, then sleep."""
         sys.stdout.flush()
+        time.sleep(seconds)
+    
+    def _arrival_schedule(self, duration_seconds, rate, bursts=False):
+        """Draw every event offset (seconds) of a phase up front; the last lands at or past the duration."""
+        rand = self._rng.random
+        gap_mean = 1.0 / rate
+        schedule = []
+        t = 0.0
+        while t < duration_seconds:
+            gap = -log(1.0 - rand()) * gap_mean
+            if bursts and rand() < 0.12:  # Slightly less frequent bursts
+                gap *= 0.1 if rand() < 0.5 else 3.5  # Gentler variation
+            t += gap
+            schedule.append(t)
+        return schedule
+    
+    @staticmethod
+    def _elapsed_until(duration_seconds):
+        """Yield real elapsed seconds, back to back, until `duration_seconds` have passed."""
+        monotonic = time.monotonic
+        start_time = monotonic()
+        elapsed = 0.0
+        while elapsed < duration_seconds:
+            yield elapsed
+            elapsed = monotonic() - start_time
+    
+    def _paced(self, schedule, mist_mode=False, pause=True):
+        """Yield at each scheduled offset, after sleeping to its deadline and decaying the state."""
+        monotonic = time.monotonic
+        start_time = monotonic()
+        last_time = 0.0
+        for event_time in schedule:
+            # Sleeping to absolute deadlines keeps oversleeps from accumulating
+            if pause:
+                delay = start_time + event_time - monotonic()
+                if delay > 0:
+                    self._pause(delay)
+            
+            # Decay over the scheduled gap
+            self.decay_state(int((event_time - last_time) * 20), mist_mode=mist_mode)
+            last_time = event_time
+            yield
     
     def experience_mist(self, duration_seconds=15):
         """Sacred misting prelude — gentle preparation."""
@@ -183,32 +397,26 @@ class RainShockSimulator:
         print("Breathing in the mist...")
         print("∼" * 70 + "\n")
         
-        start_time = time.time()
-        last_mist_time = start_time
+        rand = self._rng.random
+        generate_mist = self.generate_mist
+        apply_event = self.apply_event
+        event_display = self.event_display
         
-        while time.time() - start_time < duration_seconds:
-            wait_time = random.expovariate(self.mist_rate)
-            time.sleep(wait_time)
-            
-            # Gentle decay between mist
-            time_since_last = time.time() - last_mist_time
-            for _ in range(int(time_since_last * 20)):
-                self.decay_state(mist_mode=True)
-            
-            mist = self.generate_mist()
+        # Gentle decay between mist
+        schedule = self._arrival_schedule(duration_seconds, self.mist_rate)
+        for _ in self._paced(schedule, mist_mode=True):
+            mist = generate_mist()
             self.total_mist += 1
             
             # Mist is always subtle, but we still display it
-            self.apply_event(mist, is_mist=True)
-            if random.random() < 0.3:  # Only show some mist events
-                self.event_display(mist, is_mist=True)
-            
-            last_mist_time = time.time()
+            apply_event(mist, is_mist=True)
+            if rand() < 0.3:  # Only show some mist events
+                event_display(mist, is_mist=True)
         
         print("\n" + "∼" * 70)
         print("The mist has prepared the way...")
         print("∼" * 70 + "\n")
-        time.sleep(2)
+        self._pause(2)
     
     def experience_rain(self, duration_seconds=35, pause_between_drops=True):
         """The storm arrives — intense but not overwhelming."""
@@ -220,35 +428,106 @@ class RainShockSimulator:
         print("The rain begins to fall...")
         print("▼" * 70 + "\n")
         
-        start_time = time.time()
-        last_drop_time = start_time
+        generate_shock = self.generate_shock
+        apply_event = self.apply_event
+        event_display = self.event_display
         
-        while time.time() - start_time < duration_seconds:
-            if pause_between_drops:
-                wait_time = random.expovariate(self.drop_rate)
-                if random.random() < 0.12:  # Slightly less frequent bursts
-                    wait_time *= random.choice([0.1, 3.5])  # Gentler variation
-                time.sleep(wait_time)
+        # Finer decay between drops; unpaced drops come back to back for the
+        # same span of real time
+        if pause_between_drops:
+            drop_times = self._arrival_schedule(duration_seconds, self.drop_rate, bursts=True)
+        else:
+            drop_times = self._elapsed_until(duration_seconds)
+        for _ in self._paced(drop_times, pause=pause_between_drops):
+            shock = generate_shock()
+            self.total_drops += 1
             
-            # Finer decay between drops
-            time_since_last = time.time() - last_drop_time
-            for _ in range(int(time_since_last * 20)):
-                self.decay_state()
+            if apply_event(shock):
+                event_display(shock)
+    
+    def experience_rain_fast(self, duration_seconds=35):
+        """Run the storm offline — no sleeping, no display.
+        
+        Draws the same drop process as experience_rain against a simulated
+        clock and logs every drop, for batch analysis and export. Everything
+        the loop touches is bound to a local up front.
+        Each drop is stamped at its simulated arrival past the run's start, so
+        a real-time event logged soon after can sort before the run's tail.
+        Returns the number of drops simulated.
+        """
+        rand = self._rng.random
+        baseline = self.baseline_state
+        decay = self.shock_decay
+        chaos_lo, chaos_span = 1.0 - self.unpredictability, 2.5 * self.unpredictability
+        types = self._types
+        thunder_ids = self._thunder_ids
+        thunder_count, max_thunder = self.thunder_count, self.max_thunder
+        no_thunder = (self._shock_ids_no_thunder, self._shock_cdf_no_thunder, self._shock_total_no_thunder)
+        if thunder_count >= max_thunder:
+            ids, cdf, total = no_thunder
+        else:
+            ids, cdf, total = self._shock_ids_full, self._shock_cdf_full, self._shock_total_full
+        last_row = len(ids) - 1
+        
+        # The schedule fixes the drop count, so the log is grown once up front
+        schedule = self._arrival_schedule(duration_seconds, self.drop_rate, bursts=True)
+        n = self._ev_n
+        self._reserve_log(n + len(schedule))
+        ts_col, type_col, name_col = self._ev_ts_ns, self._ev_type, self._ev_name
+        intensity_col, chaos_col = self._ev_intensity, self._ev_chaos
+        before_col, after_col, is_mist_col = self._ev_state_before, self._ev_state_after, self._ev_is_mist
+        
+        start_ns = self._t0_wall_ns + (time.monotonic_ns() - self._t0_mono_ns)
+        state = self.current_state
+        accumulation = 0.0
+        last = 0.0
+        
+        for t in schedule:
+            # decay_state, inlined for the hot loop
+            steps = int((t - last) * 20)
+            if state > baseline:
+                state = (state - baseline) * decay ** steps + baseline
             
-            shock = self.generate_shock()
-            self.total_drops += 1
+            i = ids[bisect(cdf, rand() * total, 0, last_row)]
+            if i in thunder_ids:
+                thunder_count += 1
+                if thunder_count >= max_thunder:
+                    ids, cdf, total = no_thunder
+                    last_row = len(ids) - 1
+            key, name, min_i, span_i, _ = types[i]
+            intensity = min_i + span_i * rand()
+            chaos_factor = chaos_lo + chaos_span * rand()
+            intensity *= chaos_factor
             
-            if self.apply_event(shock):
-                self.event_display(shock)
+            ts_col[n] = start_ns + round(t * 1e9)
+            type_col[n] = i
+            name_col[n] = name
+            intensity_col[n] = intensity
+            chaos_col[n] = chaos_factor
+            before_col[n] = state
+            state += intensity
+            after_col[n] = state
+            is_mist_col[n] = False
+            n += 1
             
-            last_drop_time = time.time()
+            accumulation += intensity
+            last = t
+        
+        drops = len(schedule)
+        self._ev_n = n
+        self.current_state = state
+        self.shock_accumulation += accumulation
+        self.thunder_count = thunder_count
+        self._select_shock_table()
+        self.total_drops += drops
+        return drops
     
     def experience_clearing(self):
         """Happy ending — the clearing."""
         print("\n" + "∼" * 70)
         print("THE STORM SUBSIDES... SUNLIGHT BREAKS THROUGH")
         print("∼" * 70 + "\n")
-        time.sleep(2)
+        self._pause(2)
         
         reliefs = [
             ("🌤️ Emerging Light", -0.18),
@@ -265,7 +544,7 @@ class RainShockSimulator:
             }
             self.apply_event(event)
             self.event_display(event)
-            time.sleep(2)
+            self._pause(2)
         
         print("\nThe world feels renewed.\n")
     
@@ -285,7 +564,8 @@ class RainShockSimulator:
         print(f"Total mist events: {self.total_mist}")
         print(f"Total rain drops: {self.total_drops}")
         print(f"Thunder events: {self.thunder_count} (max allowed: {self.max_thunder})")
-        print(f"Total registered events: {len(self.shocks)}")
+        n = self._ev_n
+        print(f"Total registered events: {n}")
         print(f"Net accumulation: {self.shock_accumulation:+.3f}")
         
         displacement = self.current_state - self.baseline_state
@@ -294,35 +574,35 @@ class RainShockSimulator:
             print("Lingering serene calm remains...")
         
         # Distribution
-        type_counts = {}
-        for shock in self.shocks:
-            t = shock["type"]
-            type_counts[t] = type_counts.get(t, 0) + 1
+        type_counts = Counter(islice(self._ev_type, n))
         
         print("\nEvent Distribution:")
-        for t, count in sorted(type_counts.items(), key=lambda x: -x[1]):
-            # Check if it's a mist, shock, or relief type
-            name = (self.mist_types.get(t, {}).get("name") or 
-                   self.shock_types.get(t, {}).get("name") or 
-                   t.capitalize())
-            pct = count / len(self.shocks) * 100 if self.shocks else 0
+        for t, count in type_counts.most_common():
+            name = self._types[t][1]
+            pct = count / n * 100
             print(f"  {name:24s}: {count:3d} ({pct:5.1f}%)")
         
-        # Most intense (positive)
-        positives = [s for s in self.shocks if s["intensity"] > 0 and not s.get("is_mist", False)]
-        if positives:
+        intensity = self._ev_intensity
+        is_mist = self._ev_is_mist
+        
+        # Most intense (positive) — masks built straight off the columns, then
+        # bounded heaps over row ids; only the printed rows are ever resolved
+        shock_rows = compress(range(n), [x > 0 and not m for x, m in islice(zip(intensity, is_mist), n)])
+        top = nlargest(5, shock_rows, key=intensity.__getitem__)
+        if top:
             print("\nMost Intense Shocks:")
-            for i, s in enumerate(sorted(positives, key=lambda x: x["intensity"], reverse=True)[:5], 1):
-                ts = s["timestamp"].strftime("%H:%M:%S.%f")[:-3]
-                print(f"  {i}. {ts} - {s['name']:24s} [{s['intensity']:.3f}]")
+            for rank, i in enumerate(top, 1):
+                ts = self._event_datetime(self._ev_ts_ns[i]).strftime("%H:%M:%S.%f")[:-3]
+                print(f"  {rank}. {ts} - {self._ev_name[i]:24s} [{intensity[i]:.3f}]")
         
         # Most relieving (negative)
-        negatives = [s for s in self.shocks if s["intensity"] < 0]
-        if negatives:
+        relief_rows = compress(range(n), [x < 0 for x in islice(intensity, n)])
+        bottom = nsmallest(5, relief_rows, key=intensity.__getitem__)
+        if bottom:
             print("\nMost Relieving Moments:")
-            for i, s in enumerate(sorted(negatives, key=lambda x: x["intensity"])[:5], 1):
-                ts = s["timestamp"].strftime("%H:%M:%S.%f")[:-3]
-                print(f"  {i}. {ts} - {s['name']:24s} [{s['intensity']:.3f}]")
+            for rank, i in enumerate(bottom, 1):
+                ts = self._event_datetime(self._ev_ts_ns[i]).strftime("%H:%M:%S.%f")[:-3]
+                print(f"  {rank}. {ts} - {self._ev_name[i]:24s} [{intensity[i]:.3f}]")
         
         print("▲" * 70 + "\n")
     
@@ -335,12 +615,24 @@ class RainShockSimulator:
             f.write(f"# Thunder events: {self.thunder_count}/{self.max_thunder}\n")
             f.write(f"# Net accumulation: {self.shock_accumulation:+.3f}\n\n")
             f.write("timestamp,type,name,intensity,chaos_factor,state_before,state_after,is_mist\n")
-            for shock in self.shocks:
-                ts = shock["timestamp"].strftime("%Y-%m-%d %H:%M:%S.%f")
-                is_mist = "TRUE" if shock.get("is_mist", False) else "FALSE"
-                f.write(f"{ts},{shock['type']},{shock['name']},{shock['intensity']:.6f},")
-                f.write(f"{shock['chaos_factor']:.6f},{shock['state_before']:.6f},{shock['state_after']:.6f},{is_mist}\n")
-        print(f"✓ Exported {len(self.shocks)} events\n")
+            
+            # Build every row first and hand the file a single write. Events in the
+            # same second share a date/time prefix, so strftime runs once per second.
+            type_keys = [key for key, *_ in self._types]
+            prefixes = {}
+            rows = []
+            for ts_ns, t, name, intensity, chaos, state_before, state_after, is_mist in islice(zip(
+                    self._ev_ts_ns, self._ev_type, self._ev_name, self._ev_intensity,
+                    self._ev_chaos, self._ev_state_before, self._ev_state_after, self._ev_is_mist), self._ev_n):
+                sec, us = divmod(ts_ns // 1000, 1_000_000)
+                prefix = prefixes.get(sec)
+                if prefix is None:
+                    prefix = prefixes[sec] = datetime.fromtimestamp(sec).strftime("%Y-%m-%d %H:%M:%S")
+                is_mist = "TRUE" if is_mist else "FALSE"
+                rows.append(f"{prefix}.{us:06d},{type_keys[t]},{name},{intensity:.6f},"
+                            f"{chaos:.6f},{state_before:.6f},{state_after:.6f},{is_mist}\n")
+            f.write("".join(rows))
+        print(f"✓ Exported {self._ev_n} events\n")
 
 if __name__ == "__main__":
     print("\n")
@@ -354,6 +646,10 @@ if __name__ == "__main__":
     print("  through a complete weather transformation")
     print("═" * 70)
     
+    # Block-buffer stdout; the ceremony flushes at each pause instead of per line
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     rain = RainShockSimulator()
     rain.experience_full_cycle(mist_duration=15, rain_duration=35)
     rain.export_shock_log()